@@ -1,35 +1,88 @@
 import asyncio
+import atexit
 import os
-import json
-from typing import Optional, List, Dict, Any
+import sys
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, List, Dict, Any, Tuple
 from contextlib import AsyncExitStack
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import Tool
 
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Configure logging; tool arguments and results are only serialized at DEBUG level,
+# which can be enabled with LOG_LEVEL=DEBUG.
+# Records are written to stderr by a background listener so the event loop never
+# blocks on terminal or pipe writes.
+log_queue = queue.Queue(-1)
+stream_handler = logging.StreamHandler(sys.stderr)
+stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = QueueListener(log_queue, stream_handler)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(), handlers=[QueueHandler(log_queue)])
+log_listener.start()
+atexit.register(log_listener.stop)
+logger = logging.getLogger("ntropy-mcp-client")
+
+def install_event_loop():
+    """Use uvloop (or winloop on Windows) as the asyncio event loop if installed"""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+
+def ntropy_server_params(api_key: str) -> StdioServerParameters:
+    """Build the parameters for running the Ntropy MCP server with uvx"""
+    return StdioServerParameters(
+        command="uvx",
+        args=["ntropy-mcp", "--api-key", api_key],
+        env=None
+    )
+
 class NtropyMCPClient:
     """Client for testing the Ntropy MCP server"""
     
     def __init__(self):
         """Initialize the client"""
         self.session: Optional[ClientSession] = None
+        self.tools = None
         self.exit_stack = AsyncExitStack()
+    
+    async def __aenter__(self):
+        try:
+            await self.connect_to_server()
+        except BaseException:
+            # __aexit__ isn't called when entering fails, so close the transport here
+            await self.cleanup()
+            raise
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.cleanup()
         
     async def connect_to_server(self):
-        """Connect to the Ntropy MCP server using uvx"""
+        """Connect to the Ntropy MCP server using uvx
+        
+        The session is reused for every subsequent tool call, so this only spawns
+        the server once. Calling it again while connected is a no-op.
+        """
+        if self.session is not None:
+            return self.tools
         
         api_key = os.environ.get("NTROPY_API_KEY")
         
         # Create server parameters
-        server_params = StdioServerParameters(
-            command="uvx",
-            args=["ntropy-mcp", "--api-key", api_key],
-            env=None
-        )
+        server_params = ntropy_server_params(api_key)
         
         # Set up the connection
         stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
@@ -41,13 +94,21 @@ class NtropyMCPClient:
         
         # List available tools
         response = await self.session.list_tools()
-        tools = response.tools
+        self.tools = response.tools
         
-        print("\nAvailable tools:")
-        for tool in tools:
-            print(f"- {tool.name}: {tool.description}")
+        logger.info("Available tools:")
+        for tool in self.tools:
+            logger.info("- %s: %s", tool.name, tool.description)
         
-        return tools
+        return self.tools
+    
+    async def connect(self):
+        """Connect to the server if not already connected"""
+        return await self.connect_to_server()
+    
+    async def disconnect(self):
+        """Disconnect from the server if connected"""
+        await self.cleanup()
     
     async def call_tool(self, tool_name: str, **kwargs):
         """Call a tool on the server
@@ -59,16 +120,21 @@ class NtropyMCPClient:
         Returns:
             The result of the tool call
         """
+        return await self._call_tool_raw(tool_name, kwargs)
+    
+    async def _call_tool_raw(self, tool_name: str, args: Dict[str, Any]):
+        """Call a tool with an already-built arguments dict, avoiding a **kwargs repack"""
         if not self.session:
             raise ValueError("Not connected to server. Call connect_to_server first.")
         
-        print(f"\nCalling tool: {tool_name}")
-        print(f"Arguments: {json.dumps(kwargs, indent=2)}")
+        logger.info("Calling tool: %s", tool_name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Arguments: %s", orjson.dumps(args, option=orjson.OPT_INDENT_2).decode())
         
-        result = await self.session.call_tool(tool_name, kwargs)
+        result = await self.session.call_tool(tool_name, args)
         
-        print("\nResult:")
-        print(json.dumps(result.content, indent=2))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Result: %s", orjson.dumps(result.content, option=orjson.OPT_INDENT_2).decode())
         
         return result.content
     
@@ -97,7 +163,7 @@ class NtropyMCPClient:
         if country:
             args["country"] = country
             
-        return await self.call_tool("enrich_transaction", **args)
+        return await self._call_tool_raw("enrich_transaction", args)
     
     async def list_transactions(self, account_holder_id: str, limit: int = 10, offset: int = 0):
         """List transactions for an account holder"""
@@ -111,78 +177,200 @@ class NtropyMCPClient:
         return await self.call_tool("bulk_enrich_transactions", transactions=transactions)
     
     async def cleanup(self):
-        """Clean up resources"""
+        """Clean up resources
+        
+        Safe to call more than once; the client can reconnect afterwards.
+        """
         await self.exit_stack.aclose()
+        self.session = None
+        self.tools = None
+        self.exit_stack = AsyncExitStack()
+
+class MCPHost:
+    """Host that connects to several MCP servers and routes tool calls between them
+    
+    Servers can be connected concurrently, and tool calls are dispatched to the
+    server that registered the tool unless a server is named explicitly. When
+    several servers expose the same tool, the first one to register it wins.
+    """
+    
+    def __init__(self):
+        """Initialize the host"""
+        self.sessions: Dict[str, ClientSession] = {}
+        self.tool_registry: Dict[str, Tuple[str, Tool]] = {}
+        self.connections: Dict[str, Tuple[asyncio.Task, asyncio.Event]] = {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.cleanup()
+    
+    async def connect(self, name: str, server_params: StdioServerParameters) -> List[Tool]:
+        """Connect to an MCP server and register its tools
+        
+        Args:
+            name: Name used to refer to the server
+            server_params: Parameters for starting the server
+        
+        Returns:
+            The tools exposed by the server
+        """
+        if name in self.connections:
+            raise ValueError(f"Server '{name}' is already connected")
+        
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._run_session(name, server_params, ready, stop))
+        self.connections[name] = (task, stop)
+        try:
+            return await ready
+        except Exception:
+            del self.connections[name]
+            raise
+    
+    async def _run_session(self, name: str, server_params: StdioServerParameters,
+                           ready: asyncio.Future, stop: asyncio.Event):
+        # The stdio transport must be opened and closed by the same task, so each
+        # server gets its own task that holds the session until cleanup.
+        try:
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    response = await session.list_tools()
+                    
+                    self.sessions[name] = session
+                    for tool in response.tools:
+                        self.tool_registry.setdefault(tool.name, (name, tool))
+                    ready.set_result(response.tools)
+                    
+                    await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                raise
+        finally:
+            self.sessions.pop(name, None)
+            for tool_name, (server_name, _) in list(self.tool_registry.items()):
+                if server_name == name:
+                    del self.tool_registry[tool_name]
+    
+    async def call_tool(self, tool_name: str, args: Dict[str, Any], server: Optional[str] = None):
+        """Call a tool on the server that provides it
+        
+        Args:
+            tool_name: Name of the tool to call
+            args: Arguments to pass to the tool
+            server: Name of the server to call, overriding the tool registry
+        
+        Returns:
+            The result of the tool call
+        """
+        if server is None:
+            if tool_name not in self.tool_registry:
+                raise ValueError(f"No connected server provides tool '{tool_name}'")
+            server, _ = self.tool_registry[tool_name]
+        
+        if server not in self.sessions:
+            raise ValueError(f"Server '{server}' is not connected")
+        
+        result = await self.sessions[server].call_tool(tool_name, args)
+        return result.content
+    
+    async def cleanup(self):
+        """Disconnect from all servers"""
+        connections = list(self.connections.values())
+        self.connections.clear()
+        for _, stop in connections:
+            stop.set()
+        await asyncio.gather(*(task for task, _ in connections), return_exceptions=True)
 
 async def run():
     """Run a demonstration of the Ntropy MCP client"""
-    client = NtropyMCPClient()
-    
     try:
-        # Connect to the server using uvx
-        await client.connect_to_server()
-        
-        # Check connection to Ntropy API
-        print("\n1. Checking connection to Ntropy API...")
-        await client.check_connection()
-        
-        # Create an account holder
-        print("\n2. Creating account holder...")
-        account_holder = await client.create_account_holder(
-            id="test_user_123",
-            type="individual",
-            name="Test User"
-        )
-        
-        account_holder_id = account_holder.get("id", "test_user_123")
-        
-        # Enrich a single transaction
-        print("\n3. Enriching a single transaction...")
-        await client.enrich_transaction(
-            id="tx_001",
-            description="AMAZON.COM*MK1AB6TE1",
-            date="2023-05-15",
-            amount=-29.99,
-            entry_type="debit",
-            currency="USD",
-            account_holder_id=account_holder_id,
-            country="US"
-        )
-        
-        # Enrich a batch of transactions
-        print("\n4. Bulk enriching multiple transactions...")
-        transactions = [
-            {
-                "id": "tx_002",
-                "description": "NETFLIX.COM",
-                "date": "2023-05-16",
-                "amount": -13.99,
-                "entry_type": "debit",
-                "currency": "USD",
-                "account_holder_id": account_holder_id
-            },
-            {
-                "id": "tx_003",
-                "description": "Starbucks Coffee",
-                "date": "2023-05-17",
-                "amount": -5.65,
-                "entry_type": "debit",
-                "currency": "USD",
-                "account_holder_id": account_holder_id
-            }
-        ]
-        
-        await client.bulk_enrich_transactions(transactions)
-        
-        # List transactions for the account holder
-        print("\n5. Listing transactions for account holder...")
-        await client.list_transactions(account_holder_id)
+        # Connect to the server using uvx; the session is closed on exit
+        async with NtropyMCPClient() as client:
+            # Check connection and create an account holder concurrently
+            print("\n1. Checking connection to Ntropy API and creating account holder...")
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(client.check_connection())
+                account_holder_task = tg.create_task(client.create_account_holder(
+                    id="test_user_123",
+                    type="individual",
+                    name="Test User"
+                ))
+            # Tool results are content blocks; the first one holds the JSON response
+            account_holder = orjson.loads(account_holder_task.result()[0].text)
+
+            account_holder_id = account_holder.get("id", "test_user_123")
         
+            transactions = [
+                {
+                    "id": "tx_002",
+                    "description": "NETFLIX.COM",
+                    "date": "2023-05-16",
+                    "amount": -13.99,
+                    "entry_type": "debit",
+                    "currency": "USD",
+                    "account_holder_id": account_holder_id
+                },
+                {
+                    "id": "tx_003",
+                    "description": "Starbucks Coffee",
+                    "date": "2023-05-17",
+                    "amount": -5.65,
+                    "entry_type": "debit",
+                    "currency": "USD",
+                    "account_holder_id": account_holder_id
+                }
+            ]
+        
+            # Enrich single and bulk transactions and list transactions concurrently
+            print("\n2. Enriching transactions and listing transactions for account holder...")
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(client.enrich_transaction(
+                    id="tx_001",
+                    description="AMAZON.COM*MK1AB6TE1",
+                    date="2023-05-15",
+                    amount=-29.99,
+                    entry_type="debit",
+                    currency="USD",
+                    account_holder_id=account_holder_id,
+                    country="US"
+                ))
+                tg.create_task(client.bulk_enrich_transactions(transactions))
+                tg.create_task(client.list_transactions(account_holder_id))
+            
+    except Exception as e:
+        print(f"\nError: {str(e)}")
+
+async def run_host():
+    """Check the connection to several Ntropy environments through one host"""
+    environments = {
+        "ntropy_prod": os.environ.get("NTROPY_API_KEY"),
+        "ntropy_staging": os.environ.get("NTROPY_STAGING_API_KEY")
+    }
+    
+    try:
+        async with MCPHost() as host:
+            # Connect to all environments concurrently
+            async with asyncio.TaskGroup() as tg:
+                for name, api_key in environments.items():
+                    if api_key:
+                        tg.create_task(host.connect(name, ntropy_server_params(api_key)))
+            
+            for name in host.sessions:
+                print(f"\nChecking connection for {name}...")
+                result = await host.call_tool("check_connection", {}, server=name)
+                print(result)
     except Exception as e:
         print(f"\nError: {str(e)}")
-    finally:
-        # Clean up resources
-        await client.cleanup()
 
 if __name__ == "__main__":
-    asyncio.run(run()) 
\ No newline at end of file
+    install_event_loop()
+    asyncio.run(run())
+    
+    # Compare environments when a staging key is configured
+    if os.environ.get("NTROPY_STAGING_API_KEY"):
+        asyncio.run(run_host()) 
\ No newline at end of file
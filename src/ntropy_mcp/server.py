@@ -1,8 +1,16 @@
 from mcp.server.fastmcp import FastMCP, Context
-import requests
+import httpx
+import orjson
+import asyncio
 import os
+import sys
+import time
 import logging
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Iterable
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -10,60 +18,399 @@ logger = logging.getLogger("ntropy-mcp")
 
 mcp = FastMCP(
     "MCP server for enriching banking data using the Ntropy API",
-    dependencies=["requests"]
+    dependencies=["httpx[http2]", "orjson"]
 )
 
+# Base URL of the Ntropy API; tools use paths relative to it
+API_BASE_URL = "https://api.ntropy.com/v3"
+
 # Global API key
 API_KEY = None
 
-def handle_api_response(response, ctx: Optional[Context] = None):
+# Shared HTTP client, created once in serve() and reused by every tool
+HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+# Connection pool sizing and retry policy for the shared HTTP client
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=50)
+CONNECT_RETRIES = 3
+
+# Responses that are retried, honouring Retry-After, before being returned as errors.
+# Non-idempotent requests are only retried on 429, which means they weren't processed.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+MAX_RETRY_DELAY = 30.0
+
+# Headers for requests with a JSON body; Accept and X-API-Key are set on the client
+JSON_HEADERS = MappingProxyType({"Content-Type": "application/json"})
+
+# Bulk enrichment is split into chunks sent with bounded concurrency. The semaphore
+# is created in serve(), since asyncio primitives belong to the running event loop.
+BULK_CHUNK_SIZE = 100
+BULK_CONCURRENCY = 8
+BULK_SEMAPHORE: Optional[asyncio.Semaphore] = None
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed time-to-live"""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data: OrderedDict = OrderedDict()
+        # Keys with reads in flight, and those invalidated while being read
+        self.reading: Dict[Any, int] = {}
+        self.stale: set = set()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        item = self.data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at < time.monotonic():
+            del self.data[key]
+            return None
+        self.data.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any):
+        """Store a value, evicting the least recently used entries if full"""
+        self.data[key] = (value, time.monotonic() + self.ttl)
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+    
+    def begin_read(self, key: Any):
+        """Record that a value for key is being fetched"""
+        self.reading[key] = self.reading.get(key, 0) + 1
+    
+    def end_read(self, key: Any) -> bool:
+        """Finish a fetch started with begin_read
+        
+        Returns False if key was invalidated while the fetch was in flight, in
+        which case the fetched value may predate the write and must not be cached.
+        """
+        fresh = key not in self.stale
+        self.reading[key] -= 1
+        if not self.reading[key]:
+            del self.reading[key]
+            self.stale.discard(key)
+        return fresh
+    
+    def pop(self, key: Any):
+        """Remove a single entry if present"""
+        if key in self.reading:
+            self.stale.add(key)
+        self.data.pop(key, None)
+    
+    def discard(self, *prefix):
+        """Remove every entry whose tuple key starts with the given elements"""
+        self.stale.update(key for key in self.reading if key[:len(prefix)] == prefix)
+        for key in [key for key in self.data if key[:len(prefix)] == prefix]:
+            del self.data[key]
+    
+    def clear(self):
+        """Remove every entry"""
+        self.stale.update(self.reading)
+        self.data.clear()
+
+# Caches for read-only GET tools. Account holders change rarely, so they are kept
+# longer; transaction lists are keyed by (account_holder_id, limit, offset).
+ACCOUNT_HOLDER_CACHE = TTLCache(maxsize=4096, ttl=60)
+TRANSACTION_CACHE = TTLCache(maxsize=16384, ttl=30)
+TRANSACTION_LIST_CACHE = TTLCache(maxsize=1024, ttl=30)
+
+def clear_caches():
+    """Drop every cached GET response"""
+    ACCOUNT_HOLDER_CACHE.clear()
+    TRANSACTION_CACHE.clear()
+    TRANSACTION_LIST_CACHE.clear()
+
+# GET requests currently in flight, shared by identical concurrent calls
+INFLIGHT: Dict[tuple, asyncio.Task] = {}
+
+async def handle_api_response(response: httpx.Response, ctx: Optional[Context] = None):
     """Helper function to handle API responses and errors"""
-    try:
-        response.raise_for_status()
-        if ctx:
-            ctx.info(f"API request successful: {response.status_code}")
-        return response.json()
-    except requests.HTTPError as e:
-        error_info = {}
+    # Decode the body once; it is needed on both the success and error paths
+    body = response.content
+    data = None
+    if body:
         try:
-            error_info = response.json()
-        except:
-            error_info = {"error": str(e)}
-        
-        error_message = f"API request failed: {str(e)}"
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    
+    if response.is_success:
         if ctx:
-            ctx.error(error_message)
-        logger.error(error_message)
-        
-        return {
-            "status": "error",
-            "status_code": response.status_code,
-            "message": error_message,
-            "details": error_info
-        }
+            await ctx.info(f"API request successful: {response.status_code}")
+        # Bodiless responses such as 204 from DELETE have nothing to return
+        if data is None:
+            return {"status": "success", "status_code": response.status_code}
+        return data
+    
+    error_message = f"API request failed: {response.status_code} {response.reason_phrase} for url '{response.url}'"
+    if ctx:
+        await ctx.error(error_message)
+    logger.error(error_message)
+    
+    return {
+        "status": "error",
+        "status_code": response.status_code,
+        "message": error_message,
+        "details": data if data is not None else {"error": body[:512].decode("utf-8", "replace") or error_message}
+    }
+
+def encode_result(result: Any) -> str:
+    """Encode a large tool result as JSON text
+    
+    FastMCP passes str results through unchanged but converts anything else with
+    pydantic's to_jsonable_python and the stdlib json encoder. Encoding once with
+    orjson avoids that extra copy and the slower encoder.
+    """
+    return orjson.dumps(result).decode()
+
+def create_http_client(api_key: str) -> httpx.AsyncClient:
+    """Create the async HTTP client shared by all tools
+    
+    A single client keeps a pool of keep-alive connections to the Ntropy API
+    between tool calls and multiplexes concurrent requests over HTTP/2.
+    Failed connection attempts are retried by the transport.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=POOL_LIMITS,
+        retries=CONNECT_RETRIES
+    )
+    return httpx.AsyncClient(
+        base_url=API_BASE_URL,
+        headers={"Accept": "application/json", "X-API-Key": api_key},
+        transport=transport,
+        timeout=30.0
+    )
+
+@lru_cache(maxsize=1024)
+def resource_path(resource: str, resource_id: str | int) -> str:
+    """Path of a single API resource relative to API_BASE_URL, e.g. /transactions/{id}"""
+    return f"/{resource}/{resource_id}"
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, from Retry-After or exponential backoff"""
+    retry_after = response.headers.get("Retry-After")
+    delay = RETRY_BACKOFF * 2 ** attempt
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+async def send_request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request with the shared client, retrying rate-limited and transient failures"""
+    retry_statuses = RETRY_STATUSES if method in IDEMPOTENT_METHODS else {429}
+    for attempt in range(MAX_RETRIES + 1):
+        response = await HTTP_CLIENT.request(method, url, **kwargs)
+        if response.status_code not in retry_statuses or attempt == MAX_RETRIES:
+            return response
+        delay = retry_delay(response, attempt)
+        logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
 
-def validate_api_key(api_key: str, ctx: Optional[Context] = None) -> bool:
+async def validate_api_key(api_key: str, ctx: Optional[Context] = None) -> bool:
     """Validate the API key by making a test request to the Ntropy API"""
     if not api_key:
         if ctx:
-            ctx.error("API key is empty or invalid")
+            await ctx.error("API key is empty or invalid")
         return False
         
-    headers = {"Accept": "application/json", "X-API-Key": api_key}
     try:
-        # Make a simple request that doesn't create or modify anything
-        response = requests.get("https://api.ntropy.com/v3/status", headers=headers)
-        response.raise_for_status()
+        # Make a simple request that doesn't create or modify anything,
+        # overriding only the client's default key header
+        response = await send_request("GET", "/status", headers={"X-API-Key": api_key})
+    except httpx.HTTPError as e:
         if ctx:
-            ctx.info("API key validated successfully")
-        return True
-    except Exception as e:
+            await ctx.error(f"API key validation failed: {str(e)}")
+        return False
+    
+    if not response.is_success:
         if ctx:
-            ctx.error(f"API key validation failed: {str(e)}")
+            await ctx.error(f"API key validation failed: {response.status_code} {response.reason_phrase}")
         return False
+    
+    if ctx:
+        await ctx.info("API key validated successfully")
+    return True
+
+class TransactionCoalescer:
+    """Batch concurrent single-transaction enrichments into bulk API calls
+    
+    Transactions submitted within a short window are sent together to the bulk
+    enrichment endpoint, and each caller receives the result matching its id.
+    Batches are flushed in the background, so the next batch starts collecting
+    while earlier ones are still in flight.
+    """
+    
+    def __init__(self, max_batch_size: int = 100, flush_interval_ms: int = 25):
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+        self.flush_tasks: set = set()
+    
+    def start(self):
+        """Start the background flush task if it is not already running"""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Cancel the background flush task and any batches still in flight"""
+        tasks = [task for task in (self.task, *self.flush_tasks) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.task = None
+    
+    async def submit(self, transaction: Dict[str, Any]) -> dict:
+        """Queue a transaction for enrichment and wait for its result"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((transaction, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.flush_interval
+            
+            # Keep collecting until the window closes or the batch is full
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            flush_task = asyncio.create_task(self._flush(batch))
+            self.flush_tasks.add(flush_task)
+            flush_task.add_done_callback(self.flush_tasks.discard)
+    
+    async def _flush(self, batch):
+        try:
+            response = await send_bulk_chunk([transaction for transaction, _ in batch])
+            result = await handle_api_response(response)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        if isinstance(result, dict) and result.get("status") == "error":
+            # A single invalid transaction makes the API reject the whole batch, so
+            # retry each one on its own to keep the error with the caller that sent it.
+            # Auth and rate-limit errors apply to every transaction alike.
+            if len(batch) > 1 and 400 <= result["status_code"] < 500 \
+                    and result["status_code"] not in (401, 403, 429):
+                await asyncio.gather(*(self._flush_one(tx, future) for tx, future in batch))
+                return
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(result)
+            return
+        
+        enriched = result.get("transactions", []) if isinstance(result, dict) else result
+        enriched_by_id = {str(tx.get("id")): tx for tx in enriched}
+        for transaction, future in batch:
+            if future.done():
+                continue
+            if transaction["id"] in enriched_by_id:
+                future.set_result(enriched_by_id[transaction["id"]])
+            else:
+                future.set_result({
+                    "status": "error",
+                    "status_code": response.status_code,
+                    "message": f"No enrichment result returned for transaction {transaction['id']}",
+                    "details": {"missing_id": transaction["id"]}
+                })
+    
+    async def _flush_one(self, transaction, future):
+        """Enrich a single transaction with the non-batched endpoint"""
+        try:
+            response = await send_request(
+                "POST",
+                "/transactions",
+                content=orjson.dumps(transaction),
+                headers=JSON_HEADERS
+            )
+            result = await handle_api_response(response)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+# Coalesces enrich_transaction calls into bulk requests. Like HTTP_CLIENT it is
+# created in serve(), since its queue and tasks belong to the running event loop.
+ENRICH_COALESCER: Optional[TransactionCoalescer] = None
+
+async def single_flight_get(url: str, params: Optional[dict] = None) -> httpx.Response:
+    """GET a URL, sharing the request with identical calls already in flight"""
+    key = ("GET", url, frozenset(params.items()) if params else frozenset())
+    task = INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(send_request("GET", url, params=params))
+        INFLIGHT[key] = task
+        # Only remove our own entry; a write may have replaced it with a newer request
+        task.add_done_callback(lambda t: INFLIGHT.pop(key) if INFLIGHT.get(key) is t else None)
+    # Shield the shared request so one caller's cancellation doesn't affect the others
+    return await asyncio.shield(task)
+
+def discard_inflight(*urls: str, account_holder_ids: Iterable[str] = ()):
+    """Stop sharing in-flight GETs that may predate a write
+    
+    Drops the entries for the given paths and the transaction lists of the given
+    account holders. Requests already running are not cancelled; later calls
+    just send a fresh request instead of joining them.
+    """
+    account_holder_ids = set(account_holder_ids)
+    for key in list(INFLIGHT):
+        _, url, params = key
+        if url in urls or (url == "/transactions" and dict(params).get("account_holder_id") in account_holder_ids):
+            del INFLIGHT[key]
+
+async def cached_get(cache: TTLCache, key: Any, url: str, params: Optional[dict] = None,
+                     ctx: Optional[Context] = None):
+    """GET a resource through a read cache
+    
+    Successful responses are cached under key; errors are returned but not cached.
+    A response is also not cached if its key was invalidated while it was in
+    flight, since it may predate the write that caused the invalidation.
+    """
+    cached = cache.get(key)
+    if cached is not None:
+        if ctx:
+            await ctx.info("Returning cached response")
+        return cached
+    
+    cache.begin_read(key)
+    try:
+        response = await single_flight_get(url, params)
+        result = await handle_api_response(response, ctx)
+    finally:
+        fresh = cache.end_read(key)
+    is_error = isinstance(result, dict) and result.get("status") == "error"
+    if not is_error and fresh:
+        cache.set(key, result)
+    return result
 
 @mcp.tool()
-def check_connection(ctx: Context) -> dict:
+async def check_connection(ctx: Context) -> dict:
     """Check the connection to the Ntropy API
     
     Verifies that the current API key is valid and the Ntropy API is accessible.
@@ -74,25 +421,21 @@ def check_connection(ctx: Context) -> dict:
             On failure, includes 'status', 'message', and error details
     """
     global API_KEY
-    ctx.info("Checking connection to Ntropy API...")
+    await ctx.info("Checking connection to Ntropy API...")
     
     if not API_KEY:
-        ctx.error("No API key is configured")
+        await ctx.error("No API key is configured")
         return {
             "status": "error",
             "message": "No API key configured. Please set an API key first."
         }
     
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
     try:
-        response = requests.get("https://api.ntropy.com/v3/status", headers=headers)
-        response_data = handle_api_response(response, ctx)
+        response = await send_request("GET", "/status")
+        response_data = await handle_api_response(response, ctx)
         
         if response.status_code == 200:
-            ctx.info("Connection to Ntropy API successful")
+            await ctx.info("Connection to Ntropy API successful")
             return {
                 "status": "success",
                 "message": "Connection to Ntropy API successful",
@@ -100,7 +443,7 @@ def check_connection(ctx: Context) -> dict:
                 "details": response_data
             }
         else:
-            ctx.error(f"Connection to Ntropy API failed: {response.status_code}")
+            await ctx.error(f"Connection to Ntropy API failed: {response.status_code}")
             return {
                 "status": "error",
                 "message": f"Connection to Ntropy API failed: {response.status_code}",
@@ -108,14 +451,14 @@ def check_connection(ctx: Context) -> dict:
             }
     except Exception as e:
         error_message = f"Error connecting to Ntropy API: {str(e)}"
-        ctx.error(error_message)
+        await ctx.error(error_message)
         return {
             "status": "error",
             "message": error_message
         }
 
 @mcp.tool()
-def set_api_key(api_key: str, ctx: Context) -> dict:
+async def set_api_key(api_key: str, ctx: Context) -> dict:
     """Set or update the Ntropy API key
     
     Updates the API key used for Ntropy API requests and validates it.
@@ -129,39 +472,38 @@ def set_api_key(api_key: str, ctx: Context) -> dict:
             On failure, includes 'status', 'message', and error details
     """
     global API_KEY
-    ctx.info("Setting new API key...")
+    await ctx.info("Setting new API key...")
     
     if not api_key or len(api_key.strip()) == 0:
-        ctx.error("API key cannot be empty")
+        await ctx.error("API key cannot be empty")
         return {
             "status": "error",
             "message": "API key cannot be empty"
         }
     
-    # Store the previous API key in case validation fails
-    previous_api_key = API_KEY
-    
-    # Update the API key
-    API_KEY = api_key.strip()
-    
-    # Validate the new API key
-    if validate_api_key(API_KEY, ctx):
-        ctx.info("API key updated and validated successfully")
+    # Validate the new API key before making it visible to other tool calls,
+    # so concurrent calls never run with an unvalidated key
+    new_api_key = api_key.strip()
+    if await validate_api_key(new_api_key, ctx):
+        API_KEY = new_api_key
+        HTTP_CLIENT.headers["X-API-Key"] = new_api_key
+        # Cached and in-flight responses may belong to the previous key's account
+        clear_caches()
+        INFLIGHT.clear()
+        await ctx.info("API key updated and validated successfully")
         return {
             "status": "success",
             "message": "API key updated and validated successfully"
         }
     else:
-        # Restore the previous API key if the new one is invalid
-        API_KEY = previous_api_key
-        ctx.error("Invalid API key. Reverting to previous key if available.")
+        await ctx.error("Invalid API key. The previous API key is still in use.")
         return {
             "status": "error",
-            "message": "Invalid API key. The previous API key has been restored if available."
+            "message": "Invalid API key. The previous API key is still in use."
         }
 
 @mcp.tool()
-def create_account_holder(
+async def create_account_holder(
     id: str | int,
     type: str,
     name: str,
@@ -182,24 +524,21 @@ def create_account_holder(
             On success, includes 'id', 'name', 'type', and other account holder details
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Creating account holder: {name} (ID: {id}, Type: {type})")
+    await ctx.info(f"Creating account holder: {name} (ID: {id}, Type: {type})")
     
-    url = "https://api.ntropy.com/v3/account_holders"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "X-API-Key": API_KEY,
-    }
+    url = "/account_holders"
     data = {
         "type": type,
         "name": name,
         "id": str(id)
     }
-    response = requests.post(url, headers=headers, json=data)
-    return handle_api_response(response, ctx)
+    response = await send_request("POST", url, content=orjson.dumps(data), headers=JSON_HEADERS)
+    ACCOUNT_HOLDER_CACHE.pop(str(id))
+    discard_inflight(resource_path("account_holders", id))
+    return await handle_api_response(response, ctx)
 
 @mcp.tool()
-def update_account_holder(
+async def update_account_holder(
     id: str | int,
     name: Optional[str] = None,
     type: Optional[str] = None,
@@ -219,36 +558,32 @@ def update_account_holder(
             On success, includes 'id', 'name', 'type', and other account holder details
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Updating account holder ID: {id}")
+    await ctx.info(f"Updating account holder ID: {id}")
     
     # First, get the current account holder data
-    url = f"https://api.ntropy.com/v3/account_holders/{id}"
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": API_KEY,
-    }
+    url = resource_path("account_holders", id)
     
-    get_response = requests.get(url, headers=headers)
-    current_data = handle_api_response(get_response, ctx)
+    get_response = await single_flight_get(url)
+    current_data = await handle_api_response(get_response, ctx)
     
     # Check if we got valid data back
     if "status" in current_data and current_data["status"] == "error":
-        ctx.error(f"Failed to retrieve account holder ID {id}")
+        await ctx.error(f"Failed to retrieve account holder ID {id}")
         return current_data
     
     # Update the data with new values if provided
     update_data = {}
     if name is not None:
         update_data["name"] = name
-        ctx.info(f"Updating name to: {name}")
+        await ctx.info(f"Updating name to: {name}")
     
     if type is not None:
         update_data["type"] = type
-        ctx.info(f"Updating type to: {type}")
+        await ctx.info(f"Updating type to: {type}")
     
     # Only proceed if we have something to update
     if not update_data:
-        ctx.warning("No update parameters provided")
+        await ctx.warning("No update parameters provided")
         return {
             "status": "warning",
             "message": "No update parameters provided. Account holder remains unchanged.",
@@ -256,12 +591,49 @@ def update_account_holder(
         }
     
     # Make the update request
-    headers["Content-Type"] = "application/json"
-    response = requests.patch(url, headers=headers, json=update_data)
-    return handle_api_response(response, ctx)
+    response = await send_request("PATCH", url, content=orjson.dumps(update_data), headers=JSON_HEADERS)
+    ACCOUNT_HOLDER_CACHE.pop(str(id))
+    discard_inflight(url)
+    return await handle_api_response(response, ctx)
+
+def transaction_payload(
+    id: str | int,
+    description: str,
+    date: str,
+    amount: float,
+    entry_type: str,
+    currency: str,
+    account_holder_id: str | int,
+    country: str = None
+) -> Dict[str, Any]:
+    """Build the API representation of a transaction from enrich_transaction's parameters"""
+    data = {
+        "id": str(id),
+        "description": description,
+        "date": date,
+        "amount": amount,
+        "entry_type": entry_type,
+        "currency": currency,
+        "account_holder_id": str(account_holder_id),
+    }
+    if country:
+        data["location"] = {"country": country}
+    return data
+
+def invalidate_transactions(transactions: List[Dict[str, Any]]):
+    """Drop cached and in-flight reads of transactions that have just been enriched"""
+    account_holder_ids = {tx.get("account_holder_id") for tx in transactions}
+    for tx in transactions:
+        TRANSACTION_CACHE.pop(tx.get("id"))
+    for account_holder_id in account_holder_ids:
+        TRANSACTION_LIST_CACHE.discard(account_holder_id)
+    discard_inflight(
+        *(resource_path("transactions", tx.get("id")) for tx in transactions),
+        account_holder_ids=account_holder_ids
+    )
 
 @mcp.tool()
-def enrich_transaction(
+async def enrich_transaction(
     id: str | int,
     description: str,
     date: str,
@@ -276,7 +648,7 @@ def enrich_transaction(
     
     Sends transaction data to Ntropy for categorization and enrichment, returning
     detailed information about the transaction including merchant name, category,
-    industry, and more.
+    industry, and more. Concurrent calls are batched into a single bulk request.
     
     Parameters:
         id: Unique identifier for the transaction (will be converted to string)
@@ -293,33 +665,56 @@ def enrich_transaction(
             On success, includes categorization, merchant details, and confidence scores
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Enriching transaction: {description} (ID: {id})")
-    
-    url = "https://api.ntropy.com/v3/transactions"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
-    data = {
-        "id": str(id),
-        "description": description,
-        "date": date,
-        "amount": amount,
-        "entry_type": entry_type,
-        "currency": currency,
-        "account_holder_id": str(account_holder_id),
-    }
+    await ctx.info(f"Enriching transaction: {description} (ID: {id})")
     
+    data = transaction_payload(id, description, date, amount, entry_type, currency, account_holder_id, country)
     if country:
-        data["location"] = {"country": country}
-        ctx.info(f"Including country information: {country}")
+        await ctx.info(f"Including country information: {country}")
+        
+    result = await ENRICH_COALESCER.submit(data)
+    invalidate_transactions([data])
+    if isinstance(result, dict) and result.get("status") == "error":
+        await ctx.error(result["message"])
+    return result
+
+@mcp.tool()
+async def enrich_transactions_many(transactions: List[Dict[str, Any]], ctx: Context = None) -> dict:
+    """Enrich multiple transactions, one result per transaction
+    
+    The transactions are sent in bulk requests shared with concurrent
+    enrich_transaction calls. Unlike bulk_enrich_transactions, an invalid
+    transaction only fails its own entry; the others are still enriched.
+    
+    Parameters:
+        transactions: List of transaction dictionaries, each containing the
+            parameters of the enrich_transaction tool (id, description, date, amount,
+            entry_type, currency, account_holder_id, and optionally country)
         
-    response = requests.post(url, headers=headers, json=data)
-    return handle_api_response(response, ctx)
+    Returns:
+        dict: Contains 'transactions', a list with one entry per input transaction in order
+            Each entry is the enriched transaction data, or an error with 'status' and 'message'
+    """
+    await ctx.info(f"Enriching {len(transactions)} transactions")
+    
+    async def enrich_one(transaction: Dict[str, Any]) -> dict:
+        try:
+            data = transaction_payload(**transaction)
+        except TypeError as e:
+            # Missing or unexpected transaction fields
+            return {"status": "error", "message": f"Invalid transaction: {str(e)}"}
+        return await ENRICH_COALESCER.submit(data)
+    
+    # Every transaction is queued at once, so the coalescer fills whole batches
+    results = await asyncio.gather(*(enrich_one(tx) for tx in transactions))
+    invalidate_transactions([with_string_ids(tx) for tx in transactions])
+    
+    failed = sum(1 for r in results if isinstance(r, dict) and r.get("status") == "error")
+    if failed:
+        await ctx.error(f"{failed} of {len(transactions)} transactions could not be enriched")
+    return {"transactions": results}
 
 @mcp.tool()
-def get_account_holder(account_holder_id: str | int, ctx: Context = None) -> dict:
+async def get_account_holder(account_holder_id: str | int, ctx: Context = None) -> dict:
     """Get details of an existing account holder
     
     Retrieves complete information for an account holder by their ID.
@@ -332,23 +727,18 @@ def get_account_holder(account_holder_id: str | int, ctx: Context = None) -> dic
             On success, includes 'id', 'name', 'type', and other account details
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Getting account holder details for ID: {account_holder_id}")
+    await ctx.info(f"Getting account holder details for ID: {account_holder_id}")
     
-    url = f"https://api.ntropy.com/v3/account_holders/{account_holder_id}"
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
-    response = requests.get(url, headers=headers)
-    return handle_api_response(response, ctx)
+    url = resource_path("account_holders", account_holder_id)
+    return await cached_get(ACCOUNT_HOLDER_CACHE, str(account_holder_id), url, ctx=ctx)
 
 @mcp.tool()
-def list_transactions(
+async def list_transactions(
     account_holder_id: str | int,
     limit: int = 10,
     offset: int = 0,
     ctx: Context = None
-) -> dict:
+) -> str:
     """List transactions for a specific account holder
     
     Retrieves a paginated list of transactions associated with an account holder.
@@ -359,27 +749,23 @@ def list_transactions(
         offset: Number of transactions to skip for pagination (default: 0)
         
     Returns:
-        dict: JSON response from API containing transaction list
+        str: JSON-encoded response from API containing transaction list
             On success, includes 'data' array of transactions and pagination information
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Listing transactions for account holder ID: {account_holder_id} (limit: {limit}, offset: {offset})")
+    await ctx.info(f"Listing transactions for account holder ID: {account_holder_id} (limit: {limit}, offset: {offset})")
     
-    url = f"https://api.ntropy.com/v3/transactions"
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
+    url = "/transactions"
     params = {
         "account_holder_id": str(account_holder_id),
         "limit": limit,
         "offset": offset
     }
-    response = requests.get(url, headers=headers, params=params)
-    return handle_api_response(response, ctx)
+    key = (str(account_holder_id), limit, offset)
+    return encode_result(await cached_get(TRANSACTION_LIST_CACHE, key, url, params=params, ctx=ctx))
 
 @mcp.tool()
-def get_transaction(transaction_id: str | int, ctx: Context = None) -> dict:
+async def get_transaction(transaction_id: str | int, ctx: Context = None) -> dict:
     """Get details of a specific transaction
     
     Retrieves complete information for a single transaction by its ID.
@@ -392,22 +778,65 @@ def get_transaction(transaction_id: str | int, ctx: Context = None) -> dict:
             On success, includes all transaction fields and enrichment data
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Getting transaction details for ID: {transaction_id}")
+    await ctx.info(f"Getting transaction details for ID: {transaction_id}")
     
-    url = f"https://api.ntropy.com/v3/transactions/{transaction_id}"
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
-    response = requests.get(url, headers=headers)
-    return handle_api_response(response, ctx)
+    url = resource_path("transactions", transaction_id)
+    return await cached_get(TRANSACTION_CACHE, str(transaction_id), url, ctx=ctx)
+
+def with_string_ids(transaction: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the transaction with string IDs, copying it only if a conversion is needed"""
+    tx_id = transaction.get("id")
+    account_holder_id = transaction.get("account_holder_id")
+    if (tx_id is None or isinstance(tx_id, str)) and \
+            (account_holder_id is None or isinstance(account_holder_id, str)):
+        return transaction
+    
+    transaction = dict(transaction)
+    if tx_id is not None:
+        transaction["id"] = str(tx_id)
+    if account_holder_id is not None:
+        transaction["account_holder_id"] = str(account_holder_id)
+    return transaction
+
+async def send_bulk_chunk(transactions: List[Dict[str, Any]]) -> httpx.Response:
+    """Send one chunk of transactions to the bulk enrichment endpoint"""
+    async with BULK_SEMAPHORE:
+        return await send_request(
+            "POST",
+            "/transactions/bulk",
+            content=orjson.dumps({"transactions": transactions}),
+            headers=JSON_HEADERS
+        )
+
+async def post_bulk_chunk(transactions: List[Dict[str, Any]], ctx: Optional[Context] = None):
+    """Enrich one chunk of transactions in bulk and return the handled response"""
+    return await handle_api_response(await send_bulk_chunk(transactions), ctx)
+
+def merge_bulk_results(results: List[Any]):
+    """Merge the responses of several bulk enrichment chunks into one"""
+    if len(results) == 1:
+        return results[0]
+    
+    errors = [r for r in results if isinstance(r, dict) and r.get("status") == "error"]
+    if len(errors) == len(results):
+        return errors[0]
+    
+    merged = {"transactions": []}
+    for r in results:
+        if isinstance(r, dict) and r.get("status") == "error":
+            continue
+        merged["transactions"].extend(r.get("transactions", []) if isinstance(r, dict) else r)
+    if errors:
+        merged["errors"] = errors
+    return merged
 
 @mcp.tool()
-def bulk_enrich_transactions(transactions: List[Dict[str, Any]], ctx: Context = None) -> dict:
-    """Enrich multiple transactions in a single API call
+async def bulk_enrich_transactions(transactions: List[Dict[str, Any]], ctx: Context = None) -> str:
+    """Enrich multiple transactions in bulk
     
     Processes a batch of transactions for efficiency when dealing with multiple records.
     Each transaction must contain the same fields as required by the enrich_transaction tool.
+    Large batches are split into chunks of 100 transactions that are sent concurrently.
     This function reports progress as transactions are processed.
     
     Parameters:
@@ -422,50 +851,47 @@ def bulk_enrich_transactions(transactions: List[Dict[str, Any]], ctx: Context =
             - location: Optional dict with 'country' field
         
     Returns:
-        dict: JSON response from API containing batch processing results
+        str: JSON-encoded response from API containing batch processing results
             On success, includes array of processed transactions with enrichment data
+            If only some chunks fail, also includes their error responses under 'errors'
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
     transaction_count = len(transactions)
-    ctx.info(f"Bulk enriching {transaction_count} transactions")
+    await ctx.info(f"Bulk enriching {transaction_count} transactions")
     
     # Report starting progress
-    ctx.report_progress(0, transaction_count)
+    await ctx.report_progress(0, transaction_count)
     
-    url = "https://api.ntropy.com/v3/transactions/bulk"
-    headers = {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
+    # Make sure all transaction IDs are strings without touching the caller's data
+    transactions = [with_string_ids(tx) for tx in transactions]
+    await ctx.info(f"Sending {transaction_count} transactions to Ntropy API")
     
-    # Make sure all transaction IDs are strings
-    for i, tx in enumerate(transactions):
-        if i > 0 and i % 10 == 0:
-            # Report progress for every 10 transactions processed
-            ctx.report_progress(i, transaction_count)
-            ctx.info(f"Preparing transaction {i}/{transaction_count}")
-            
-        if "id" in tx:
-            tx["id"] = str(tx["id"])
-        if "account_holder_id" in tx:
-            tx["account_holder_id"] = str(tx["account_holder_id"])
+    chunks = [
+        transactions[i:i + BULK_CHUNK_SIZE]
+        for i in range(0, max(transaction_count, 1), BULK_CHUNK_SIZE)
+    ]
+    completed = 0
+    
+    async def send_chunk(chunk):
+        nonlocal completed
+        chunk_result = await post_bulk_chunk(chunk, ctx)
+        # Report progress as each chunk completes
+        completed += len(chunk)
+        await ctx.report_progress(completed, transaction_count)
+        return chunk_result
     
-    # Final progress update before API call
-    ctx.report_progress(transaction_count - 1, transaction_count)
-    ctx.info(f"Sending {transaction_count} transactions to Ntropy API")
+    results = await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+    result = merge_bulk_results(results)
     
-    data = {"transactions": transactions}
-    response = requests.post(url, headers=headers, json=data)
-    result = handle_api_response(response, ctx)
+    invalidate_transactions(transactions)
     
     # Final progress update after API call
-    ctx.report_progress(transaction_count, transaction_count)
+    await ctx.report_progress(transaction_count, transaction_count)
     
-    return result
+    return encode_result(result)
 
 @mcp.tool()
-def delete_account_holder(account_holder_id: str | int, ctx: Context = None) -> dict:
+async def delete_account_holder(account_holder_id: str | int, ctx: Context = None) -> dict:
     """Delete an account holder and all associated data
     
     Permanently removes an account holder and all of their transactions from Ntropy.
@@ -479,19 +905,20 @@ def delete_account_holder(account_holder_id: str | int, ctx: Context = None) ->
             On success, includes confirmation message
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Deleting account holder ID: {account_holder_id}")
-    ctx.warning("This operation will permanently delete the account holder and all associated data")
-    
-    url = f"https://api.ntropy.com/v3/account_holders/{account_holder_id}"
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
-    response = requests.delete(url, headers=headers)
-    return handle_api_response(response, ctx)
+    await ctx.info(f"Deleting account holder ID: {account_holder_id}")
+    await ctx.warning("This operation will permanently delete the account holder and all associated data")
+    
+    url = resource_path("account_holders", account_holder_id)
+    response = await send_request("DELETE", url)
+    # Deleting an account holder also deletes its transactions
+    ACCOUNT_HOLDER_CACHE.pop(str(account_holder_id))
+    TRANSACTION_LIST_CACHE.discard(str(account_holder_id))
+    TRANSACTION_CACHE.clear()
+    discard_inflight(url, account_holder_ids=[str(account_holder_id)])
+    return await handle_api_response(response, ctx)
 
 @mcp.tool()
-def delete_transaction(transaction_id: str | int, ctx: Context = None) -> dict:
+async def delete_transaction(transaction_id: str | int, ctx: Context = None) -> dict:
     """Delete a specific transaction
     
     Permanently removes a transaction from Ntropy.
@@ -505,16 +932,51 @@ def delete_transaction(transaction_id: str | int, ctx: Context = None) -> dict:
             On success, includes confirmation message
             On failure, includes 'status', 'status_code', 'message', and 'details'
     """
-    ctx.info(f"Deleting transaction ID: {transaction_id}")
-    ctx.warning("This operation will permanently delete the transaction")
+    await ctx.info(f"Deleting transaction ID: {transaction_id}")
+    await ctx.warning("This operation will permanently delete the transaction")
+    
+    url = resource_path("transactions", transaction_id)
+    response = await send_request("DELETE", url)
+    TRANSACTION_CACHE.pop(str(transaction_id))
+    TRANSACTION_LIST_CACHE.clear()
+    # The account holder isn't known, so no transaction list can be trusted
+    discard_inflight(url, "/transactions")
+    return await handle_api_response(response, ctx)
+
+def install_event_loop():
+    """Use uvloop (or winloop on Windows) as the asyncio event loop if installed"""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+    logger.info(f"Using {loop_impl.__name__} event loop")
+
+async def serve(api_key: str):
+    """Validate the API key and run the MCP server on a single event loop
     
-    url = f"https://api.ntropy.com/v3/transactions/{transaction_id}"
-    headers = {
-        "Accept": "application/json",
-        "X-API-Key": API_KEY
-    }
-    response = requests.delete(url, headers=headers)
-    return handle_api_response(response, ctx)
+    The shared HTTP client lives for the whole run, so the connection opened to
+    validate the key is reused by the first tool calls and closed on shutdown.
+    """
+    global HTTP_CLIENT, ENRICH_COALESCER, BULK_SEMAPHORE
+    async with create_http_client(api_key) as client:
+        HTTP_CLIENT = client
+        BULK_SEMAPHORE = asyncio.Semaphore(BULK_CONCURRENCY)
+        ENRICH_COALESCER = TransactionCoalescer(max_batch_size=BULK_CHUNK_SIZE)
+        ENRICH_COALESCER.start()
+        try:
+            # Basic API key validation
+            if not await validate_api_key(api_key):
+                logger.error("Invalid Ntropy API key")
+                raise ValueError("Invalid Ntropy API key. Please check your API key and try again.")
+            
+            logger.info("Starting Ntropy MCP server...")
+            await mcp.run_stdio_async()
+        finally:
+            await ENRICH_COALESCER.stop()
 
 def main(api_key: str):
     global API_KEY
@@ -525,14 +987,13 @@ def main(api_key: str):
         logger.error("Ntropy API key is required")
         raise ValueError("Ntropy API key is required")
     
-    # Basic API key validation
-    if not validate_api_key(API_KEY):
-        logger.error("Invalid Ntropy API key")
-        raise ValueError("Invalid Ntropy API key. Please check your API key and try again.")
+    # Must happen before any event loop is created
+    install_event_loop()
     
-    logger.info("Starting Ntropy MCP server...")
     try:
-        mcp.run()
+        asyncio.run(serve(API_KEY))
+    except ValueError:
+        raise
     except Exception as e:
         logger.error(f"Error running MCP server: {str(e)}")
         raise